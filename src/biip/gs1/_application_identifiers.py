@@ -73,8 +73,10 @@ class GS1ApplicationIdentifier:
             Number (GTIN)', data_title='GTIN', fnc1_required=False,
             format='N2+N14')
         """
-        for application_identifier in _GS1_APPLICATION_IDENTIFIERS.values():
-            if value.startswith(application_identifier.ai):
+        # AIs are prefix-free, so at most one of the lookups can match.
+        for length in _GS1_APPLICATION_IDENTIFIER_LENGTHS:
+            application_identifier = _GS1_APPLICATION_IDENTIFIERS.get(value[:length])
+            if application_identifier is not None:
                 return application_identifier
 
         msg = f"Failed to get GS1 Application Identifier from {value!r}."
@@ -99,3 +101,6 @@ _GS1_APPLICATION_IDENTIFIERS = {
         for kwargs in json.loads(_GS1_APPLICATION_IDENTIFIERS_FILE.read_text())
     ]
 }
+_GS1_APPLICATION_IDENTIFIER_LENGTHS = sorted(
+    {len(ai) for ai in _GS1_APPLICATION_IDENTIFIERS}
+)
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import calendar
 import datetime as dt
+import functools
 import re
 from dataclasses import dataclass
 from decimal import Decimal
@@ -148,8 +149,7 @@ class GS1ElementString:
         for separator_char in separator_chars:
             value = value.split(separator_char, maxsplit=1)[0]
 
-        pattern = ai.pattern.removesuffix("$")
-        matches = re.match(pattern, value)
+        matches = _compile_pattern(ai.pattern).match(value)
         if not matches:
             msg = f"Failed to match {value!r} with GS1 AI {ai} pattern '{ai.pattern}'."
             raise ParseError(msg)
@@ -211,7 +211,7 @@ class GS1ElementString:
             self.sscc_error = str(exc)
 
     def _set_date_and_datetime(self) -> None:
-        if self.ai.ai not in (
+        if self.ai.ai not in {
             "11",
             "12",
             "13",
@@ -226,7 +226,7 @@ class GS1ElementString:
             "7007",
             "7011",
             "8008",
-        ):
+        }:
             return
 
         try:
@@ -236,14 +236,14 @@ class GS1ElementString:
             raise ParseError(msg) from exc
 
     def _set_decimal(self) -> None:
-        variable_measure = self.ai.ai[:2] in (
+        variable_measure = self.ai.ai[:2] in {
             "31",
             "32",
             "33",
             "34",
             "35",
             "36",
-        )
+        }
         amount_payable = self.ai.ai[:3] in ("390", "392")
         amount_payable_with_currency = self.ai.ai[:3] in ("391", "393")
         percentage = self.ai.ai[:3] in ("394",)
@@ -311,6 +311,16 @@ def _parse_date_and_datetime(value: str) -> tuple[dt.date, Optional[dt.datetime]
     return date, dt.datetime(year, month, day, hour, minute, seconds)  # noqa: DTZ001
 
 
+@functools.cache
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile an AI pattern for matching the start of a value.
+
+    The end anchor is removed, as the value may contain more Element Strings.
+    The cache is bounded by the number of AIs.
+    """
+    return re.compile(pattern.removesuffix("$"))
+
+
 def _get_century(two_digit_year: int) -> int:
     """Get century from two-digit year.
 
@@ -22,6 +22,10 @@ if TYPE_CHECKING:
     from biip.gtin import RcnRegion
 
 
+# Matches each "(AI)DATA" pair of a GS1 message in HRI format.
+_HRI_PATTERN = re.compile(r"\((\d+)\)(\w+)")
+
+
 @dataclass
 class GS1Message:
     """A GS1 message is the result of a single barcode scan.
@@ -72,8 +76,10 @@ class GS1Message:
             ParseError: If the parsing fails.
         """
         value = value.strip()
+        separator_chars = tuple(separator_chars)
+        all_separator_chars = "".join(separator_chars)
         element_strings: list[GS1ElementString] = []
-        rest = value[:]
+        rest = value
 
         while rest:
             element_string = GS1ElementString.extract(
@@ -89,8 +95,7 @@ class GS1Message:
             # Separator characters are accepted inbetween any element string,
             # even if the AI doesn't require it. See GS1 General Specifications,
             # section 7.8.6 for details.
-            while rest.startswith(tuple(separator_chars)):
-                rest = rest[1:]
+            rest = rest.lstrip(all_separator_chars)
 
         return cls(value=value, element_strings=element_strings)
 
@@ -125,8 +130,7 @@ class GS1Message:
             msg = f"Expected HRI string {value!r} to start with a parenthesis."
             raise ParseError(msg)
 
-        pattern = r"\((\d+)\)(\w+)"
-        matches: list[tuple[str, str]] = re.findall(pattern, value)
+        matches: list[tuple[str, str]] = _HRI_PATTERN.findall(value)
         if not matches:
             msg = (
                 f"Could not find any GS1 Application Identifiers in {value!r}. "
@@ -61,15 +61,15 @@ class GS1Prefix:
         """
         prefix = ""
 
-        for prefix_range in _GS1_PREFIX_RANGES:
-            prefix = value[: prefix_range.length]
+        for length, usages in _GS1_PREFIX_USAGES.items():
+            prefix = value[:length]
 
             if not prefix.isdecimal():
                 continue
-            number = int(prefix)
 
-            if prefix_range.min_value <= number <= prefix_range.max_value:
-                return cls(value=prefix, usage=prefix_range.usage)
+            usage = usages.get(int(prefix))
+            if usage is not None:
+                return cls(value=prefix, usage=usage)
 
         if not prefix.isdecimal():
             # `prefix` is now the shortest prefix possible, and should be
@@ -148,6 +148,20 @@ _GS1_PREFIX_RANGES = [
     for kwargs in json.loads(_GS1_PREFIX_RANGES_FILE.read_text())
 ]
 
+# The prefix ranges expanded to a usage per prefix number, grouped by prefix
+# length. The longest prefixes come first, as they take precedence.
+_GS1_PREFIX_USAGES: dict[int, dict[int, str]] = {
+    length: {
+        number: prefix_range.usage
+        for prefix_range in _GS1_PREFIX_RANGES
+        if prefix_range.length == length
+        for number in range(prefix_range.min_value, prefix_range.max_value + 1)
+    }
+    for length in sorted(
+        {prefix_range.length for prefix_range in _GS1_PREFIX_RANGES}, reverse=True
+    )
+}
+
 _GS1_COMPANY_PREFIX_TRIE_FILE = (
     resources.files("biip") / "gs1" / "_company_prefix_trie.json.lzma"
 )
@@ -55,19 +55,34 @@ class GS1Symbology(Enum):
     @classmethod
     def with_ai_element_strings(cls) -> set[GS1Symbology]:
         """Symbologies that may contain AI Element Strings."""
-        return {
-            cls.GS1_128,
-            cls.GS1_DATABAR,
-            cls.GS1_DATAMATRIX,
-            cls.GS1_QR_CODE,
-            cls.GS1_DOTCODE,
-        }
+        return set(_WITH_AI_ELEMENT_STRINGS)
 
     @classmethod
     def with_gtin(cls) -> set[GS1Symbology]:
         """Symbologies that may contain GTINs."""
-        return {cls.EAN_13, cls.EAN_13_WITH_ADD_ON, cls.EAN_8, cls.ITF_14}
+        return set(_WITH_GTIN)
 
     def __repr__(self) -> str:
         """Canonical string representation of format."""
         return f"GS1Symbology.{self.name}"
+
+
+# Built once, as the sets are checked on every call to biip.parse(). The
+# helpers above return copies, so callers can still modify their results.
+_WITH_AI_ELEMENT_STRINGS = frozenset(
+    {
+        GS1Symbology.GS1_128,
+        GS1Symbology.GS1_DATABAR,
+        GS1Symbology.GS1_DATAMATRIX,
+        GS1Symbology.GS1_QR_CODE,
+        GS1Symbology.GS1_DOTCODE,
+    }
+)
+_WITH_GTIN = frozenset(
+    {
+        GS1Symbology.EAN_13,
+        GS1Symbology.EAN_13_WITH_ADD_ON,
+        GS1Symbology.EAN_8,
+        GS1Symbology.ITF_14,
+    }
+)
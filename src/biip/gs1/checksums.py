@@ -1,6 +1,13 @@
 """Checksum algorithms used by GS1 standards."""
 
+from __future__ import annotations
+
 import itertools
+import operator
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
 
 def numeric_check_digit(value: str) -> int:
@@ -29,12 +36,13 @@ def numeric_check_digit(value: str) -> int:
         msg = f"Expected numeric value, got {value!r}."
         raise ValueError(msg)
 
-    digits = list(map(int, list(value)))
-    reversed_digits = reversed(digits)
-
-    weighted_sum = 0
-    for digit, weight in zip(reversed_digits, itertools.cycle([3, 1])):
-        weighted_sum += digit * weight
+    digits: Iterable[int]
+    if value.isascii():
+        digits = value[::-1].encode("ascii").translate(_ASCII_DIGIT_VALUES)
+    else:
+        # Other Unicode decimal digits are converted one by one.
+        digits = map(int, reversed(value))
+    weighted_sum: int = sum(map(operator.mul, digits, itertools.cycle((3, 1))))
 
     return (10 - weighted_sum % 10) % 10
 
@@ -76,24 +84,26 @@ def price_check_digit(value: str) -> int:
 
 
 def _four_digit_price_check_digit(value: str) -> int:
-    digits = list(map(int, list(value)))
     weight_sum = 0
-    for digit, weight_map in zip(digits, _FOUR_DIGIT_POSITION_WEIGHTS):
+    for digit, weight_map in zip(map(int, value), _FOUR_DIGIT_POSITION_WEIGHTS):
         weight = weight_map[digit]
         weight_sum += weight
     return (weight_sum * 3) % 10
 
 
 def _five_digit_price_check_digit(value: str) -> int:
-    digits = list(map(int, list(value)))
     weighted_sum = 0
-    for digit, weight_map in zip(digits, _FIVE_DIGIT_POSITION_WEIGHTS):
+    for digit, weight_map in zip(map(int, value), _FIVE_DIGIT_POSITION_WEIGHTS):
         weight = weight_map[digit]
         weighted_sum += weight
     result = (10 - weighted_sum % 10) % 10
     return _FIVE_MINUS_WEIGHT_REVERSE[result]
 
 
+# Maps ASCII digits to their numeric values, so that all digits can be
+# converted in a single call to bytes.translate().
+_ASCII_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
 # See GS1 General Specification, section 7.9.2 for details.
 _TWO_MINUS_WEIGHT = {0: 0, 1: 2, 2: 4, 3: 6, 4: 8, 5: 9, 6: 1, 7: 3, 8: 5, 9: 7}
 _THREE_WEIGHT = {0: 0, 1: 3, 2: 6, 3: 9, 4: 2, 5: 5, 6: 8, 7: 1, 8: 4, 9: 7}
@@ -88,10 +88,13 @@ class RcnRegion(Enum):
 
     def get_currency_code(self) -> Optional[str]:
         """Get the ISO-4217 currency code for the region."""
-        return {
-            RcnRegion.DENMARK: "DKK",
-            RcnRegion.GERMANY: "EUR",
-            RcnRegion.GREAT_BRITAIN: "GBP",
-            RcnRegion.NORWAY: "NOK",
-            RcnRegion.SWEDEN: "SEK",
-        }.get(self)
+        return _RCN_REGION_CURRENCY_CODES.get(self)
+
+
+_RCN_REGION_CURRENCY_CODES: dict[RcnRegion, str] = {
+    RcnRegion.DENMARK: "DKK",
+    RcnRegion.GERMANY: "EUR",
+    RcnRegion.GREAT_BRITAIN: "GBP",
+    RcnRegion.NORWAY: "NOK",
+    RcnRegion.SWEDEN: "SEK",
+}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
@@ -70,10 +71,7 @@ class Rcn(Gtin):
         # get here unless it is known.
         assert self.prefix is not None
 
-        if "within a geographic region" in self.prefix.usage:
-            self.usage = RcnUsage.GEOGRAPHICAL
-        if "within a company" in self.prefix.usage:
-            self.usage = RcnUsage.COMPANY
+        self.usage = _get_rcn_usage(self.prefix.usage) or self.usage
 
     def _parse_with_regional_rules(
         self,
@@ -95,20 +93,26 @@ class Rcn(Gtin):
             # Without a strategy, we cannot extract anything.
             return
 
+        rcn_13 = self.as_gtin_13()
+
         if verify_variable_measure:
-            strategy.verify_check_digit(self)
+            strategy.verify_check_digit(self, rcn_13)
 
-        if strategy.measure_type == _MeasureType.WEIGHT:
-            self.weight = strategy.get_variable_measure(self)
+        if strategy.measure_type is _MeasureType.WEIGHT:
+            self.weight = strategy.get_variable_measure(rcn_13)
 
-        if strategy.measure_type == _MeasureType.COUNT:
-            self.count = int(strategy.get_variable_measure(self))
+        if strategy.measure_type is _MeasureType.COUNT:
+            self.count = int(strategy.get_variable_measure(rcn_13))
 
-        if strategy.measure_type == _MeasureType.PRICE:
-            self.price = strategy.get_variable_measure(self)
+        if strategy.measure_type is _MeasureType.PRICE:
+            self.price = strategy.get_variable_measure(rcn_13)
 
-        currency_code = self.region.get_currency_code()
-        if self.price is not None and have_moneyed and currency_code is not None:
+        # Only look up the currency if there is a price to create Money from.
+        if (
+            self.price is not None
+            and have_moneyed
+            and (currency_code := self.region.get_currency_code()) is not None
+        ):
             import moneyed
 
             self.money = moneyed.Money(amount=self.price, currency=currency_code)
@@ -149,7 +153,20 @@ class Rcn(Gtin):
         return strategy.without_variable_measure(self)
 
 
-class _MeasureType(str, Enum):
+@functools.cache
+def _get_rcn_usage(prefix_usage: str) -> Optional[RcnUsage]:
+    """Classify the usage description of a GS1 Prefix.
+
+    The cache is bounded by the number of GS1 Prefix usage descriptions.
+    """
+    if "within a geographic region" in prefix_usage:
+        return RcnUsage.GEOGRAPHICAL
+    if "within a company" in prefix_usage:
+        return RcnUsage.COMPANY
+    return None
+
+
+class _MeasureType(Enum):
     COUNT = "count"
     PRICE = "price"
     WEIGHT = "weight"
@@ -164,6 +181,8 @@ class _Strategy:
     prefix_slice: slice = field(init=False)
     value_slice: slice = field(init=False)
     check_digit_slice: Optional[slice] = field(init=False)
+    zeroed_measure: str = field(init=False)
+    divisor: Decimal = field(init=False)
 
     @classmethod
     def get_for_rcn(cls, rcn: Rcn) -> Optional[_Strategy]:
@@ -171,41 +190,51 @@ class _Strategy:
         # strategy for interpreting the RCN's variable measure.
         assert rcn.region is not None
 
-        region_rules = _RCN_RULES.get(rcn.region)
-        if region_rules is None:  # pragma: no cover
-            msg = "RCN region defined without defining rules. This is a bug."
-            raise Exception(msg)  # noqa: TRY002
-
         # Classification as RCN depends on the prefix being known, so we won't
         # get here unless it is known.
         assert rcn.prefix is not None
 
-        rcn_prefix = rcn.prefix.value[:2]
-        return region_rules.get(rcn_prefix)
+        return _RCN_STRATEGIES.get((rcn.region, rcn.prefix.value[:2]))
 
     def __post_init__(self) -> None:
         assert len(self.pattern) == 12, "Pattern must be exactly 12 chars long."
 
-        prefix_slice = self._get_pattern_slice("P")
-        value_slice = self._get_pattern_slice("V")
+        # Find the first and last position of each marker in a single pass.
+        first: dict[str, int] = {}
+        last: dict[str, int] = {}
+        for index, char in enumerate(self.pattern):
+            first.setdefault(char, index)
+            last[char] = index
+        slices = {char: slice(first[char], last[char] + 1) for char in first}
+
+        prefix_slice = slices.get("P")
+        value_slice = slices.get("V")
 
         assert prefix_slice is not None, "Pattern must contain a prefix marker (P)."
         assert value_slice is not None, "Pattern must contain a value marker (V)."
+        assert prefix_slice.start == 0, "Pattern must start with the prefix (P)."
 
         self.prefix_slice = prefix_slice
         self.value_slice = value_slice
-        self.check_digit_slice = self._get_pattern_slice("C")
+        self.check_digit_slice = slices.get("C")
+
+        # Everything after the prefix is the same for all RCNs with a zeroed out
+        # variable measure, including the variable measure's check digit, if any.
+        zeroed_value = "0" * (value_slice.stop - value_slice.start)
+        digits = list(self.pattern)
+        digits[self.value_slice] = list(zeroed_value)
+        if self.check_digit_slice is not None:
+            digits[self.check_digit_slice] = [
+                str(checksums.price_check_digit(zeroed_value))
+            ]
+        self.zeroed_measure = "".join(digits[prefix_slice.stop :])
 
-    def _get_pattern_slice(self, char: str) -> Optional[slice]:
-        if char not in self.pattern:
-            return None
-        return slice(self.pattern.index(char), self.pattern.rindex(char) + 1)
+        self.divisor = Decimal(10) ** self.num_decimals
 
-    def verify_check_digit(self, rcn: Rcn) -> None:
+    def verify_check_digit(self, rcn: Rcn, rcn_13: str) -> None:
         if self.check_digit_slice is None:
             return
 
-        rcn_13 = rcn.as_gtin_13()
         value = rcn_13[self.value_slice]
         check_digit = int(rcn_13[self.check_digit_slice])
         calculated_check_digit = checksums.price_check_digit(value)
@@ -218,27 +247,16 @@ class _Strategy:
             )
             raise ParseError(msg)
 
-    def get_variable_measure(self, rcn: Rcn) -> Decimal:
-        rcn_13 = rcn.as_gtin_13()
+    def get_variable_measure(self, rcn_13: str) -> Decimal:
         value = Decimal(rcn_13[self.value_slice])
-        return value / Decimal(10) ** self.num_decimals
+        return value / self.divisor
 
     def without_variable_measure(self, rcn: Rcn) -> Gtin:
         # Zero out the variable measure part of the payload, and recalculate both
         # the GTIN check digit and the variable measure's check digit digit, if any.
 
         rcn_13 = rcn.as_gtin_13()
-        zeroed_value = "0" * len(rcn_13[self.value_slice])
-
-        digits = list(self.pattern)
-        digits[self.prefix_slice] = list(rcn_13[self.prefix_slice])
-        digits[self.value_slice] = list(zeroed_value)
-        if self.check_digit_slice is not None:
-            digits[self.check_digit_slice] = [
-                str(checksums.price_check_digit(zeroed_value))
-            ]
-
-        gtin_payload = "".join(digits)
+        gtin_payload = f"{rcn_13[self.prefix_slice]}{self.zeroed_measure}"
         gtin_check_digit = checksums.numeric_check_digit(gtin_payload)
         gtin = f"{gtin_payload}{gtin_check_digit}"
         return Gtin.parse(gtin, rcn_region=rcn.region)
@@ -322,3 +340,10 @@ _RCN_RULES: dict[RcnRegion, dict[str, _Strategy]] = {
         "25": _Strategy(_MeasureType.WEIGHT, "PPPPPPPPVVVV", num_decimals=1),
     },
 }
+
+# Flattened view of the rules above, for a single lookup per RCN.
+_RCN_STRATEGIES: dict[tuple[RcnRegion, str], _Strategy] = {
+    (region, rcn_prefix): strategy
+    for region, region_rules in _RCN_RULES.items()
+    for rcn_prefix, strategy in region_rules.items()
+}
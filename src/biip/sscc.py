@@ -133,8 +133,6 @@ class Sscc:
         Returns:
             A human-readable string where the logic parts are separated by whitespace.
         """
-        value = self.payload[1:]  # Strip extension digit
-
         if company_prefix_length is not None:
             # Using override of GS1 Company Prefix length
             if not (7 <= company_prefix_length <= 10):
@@ -147,9 +145,14 @@ class Sscc:
             # Using auto-detected GS1 Company Prefix length
             company_prefix_length = len(self.company_prefix.value)
 
-        if company_prefix_length is None:
-            return f"{self.extension_digit} {value} {self.check_digit}"
-
-        company_prefix = value[:company_prefix_length]
-        serial = value[company_prefix_length:]
-        return f"{self.extension_digit} {company_prefix} {serial} {self.check_digit}"
+        # Slice directly from the payload, skipping the extension digit. Without
+        # a company prefix length, the company prefix is empty and the whole
+        # reference is rendered as a single group.
+        serial_start = 1 + (company_prefix_length or 0)
+        company_prefix = self.payload[1:serial_start]
+        separator = " " if company_prefix else ""
+        serial = self.payload[serial_start:]
+        return (
+            f"{self.extension_digit} {company_prefix}{separator}{serial} "
+            f"{self.check_digit}"
+        )
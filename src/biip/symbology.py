@@ -177,29 +177,27 @@ class SymbologyIdentifier:
             )
             raise ParseError(msg)
 
-        try:
-            symbology = Symbology(value[1])
-        except ValueError as exc:
+        symbology = _SYMBOLOGIES.get(value[1])
+        if symbology is None:
             msg = (
                 f"Failed to get Symbology Identifier from {value!r}. "
                 f"{value[1]!r} is not a recognized code character."
             )
-            raise ParseError(msg) from exc
+            raise ParseError(msg)
 
-        if symbology == Symbology.SYSTEM_EXPANSION:
+        if symbology is Symbology.SYSTEM_EXPANSION:
             modifiers_length = int(value[2]) + 1
         else:
             modifiers_length = 1
 
         modifiers = value[2 : 2 + modifiers_length]
 
-        value = f"]{symbology.value}{modifiers}"
+        # The identifier is the flag character, code character, and modifiers,
+        # which is exactly the start of the value.
+        value = value[: 2 + modifiers_length]
 
-        gs1_symbology: Optional[GS1Symbology]
-        try:
-            gs1_symbology = GS1Symbology(f"{symbology.value}{modifiers}")
-        except ValueError:
-            gs1_symbology = None
+        # The GS1 Symbology is keyed on the code character and modifiers.
+        gs1_symbology = _GS1_SYMBOLOGIES.get(value[1:])
 
         return cls(
             value=value,
@@ -215,3 +213,9 @@ class SymbologyIdentifier:
     def __str__(self) -> str:
         """Get the string representation of the Symbology Identifier."""
         return self.value
+
+
+# Lookup tables used instead of calling the enums, which raise and catch a
+# ValueError for every unknown value.
+_SYMBOLOGIES = {symbology.value: symbology for symbology in Symbology}
+_GS1_SYMBOLOGIES = {symbology.value: symbology for symbology in GS1Symbology}
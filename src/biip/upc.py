@@ -186,15 +186,17 @@ class Upc:
             )
             raise ParseError(msg)
 
-        # Control that check digit is correct.
-        upc_a_payload = _upc_e_to_upc_a_expansion(f"{payload}{check_digit}")[:-1]
-        calculated_check_digit = numeric_check_digit(upc_a_payload)
-        if check_digit != calculated_check_digit:
-            msg = (
-                f"Invalid UPC-E check digit for {value!r}: "
-                f"Expected {calculated_check_digit!r}, got {check_digit!r}."
-            )
-            raise ParseError(msg)
+        # Control that check digit is correct. Without an explicit check
+        # digit, it has just been calculated from the payload.
+        if length == 8:
+            upc_a_payload = _upc_e_to_upc_a_expansion(value)[:-1]
+            calculated_check_digit = numeric_check_digit(upc_a_payload)
+            if check_digit != calculated_check_digit:
+                msg = (
+                    f"Invalid UPC-E check digit for {value!r}: "
+                    f"Expected {calculated_check_digit!r}, got {check_digit!r}."
+                )
+                raise ParseError(msg)
 
         return cls(
             value=value,
@@ -213,10 +215,10 @@ class Upc:
         References:
             GS1 General Specifications, section 5.2.2.4.2
         """
-        if self.format == UpcFormat.UPC_A:
+        if self.format is UpcFormat.UPC_A:
             return f"{self.payload}{self.check_digit}"
 
-        if self.format == UpcFormat.UPC_E:
+        if self.format is UpcFormat.UPC_E:
             return _upc_e_to_upc_a_expansion(f"{self.payload}{self.check_digit}")
 
         msg = (  # pragma: no cover
@@ -236,10 +238,10 @@ class Upc:
         References:
             GS1 General Specifications, section 5.2.2.4.1
         """
-        if self.format == UpcFormat.UPC_A:
+        if self.format is UpcFormat.UPC_A:
             return _upc_a_to_upc_e_suppression(f"{self.payload}{self.check_digit}")
 
-        if self.format == UpcFormat.UPC_E:
+        if self.format is UpcFormat.UPC_E:
             return f"{self.payload}{self.check_digit}"
 
         msg = (  # pragma: no cover
@@ -249,31 +251,25 @@ class Upc:
 
     def as_gtin_12(self) -> str:
         """Format as GTIN-12."""
-        from biip.gtin import Gtin
-
-        return Gtin.parse(self.as_upc_a()).as_gtin_12()
+        # An UPC-A value is also a valid GTIN-12 value.
+        return self.as_upc_a()
 
     def as_gtin_13(self) -> str:
         """Format as GTIN-13."""
-        from biip.gtin import Gtin
-
-        return Gtin.parse(self.as_upc_a()).as_gtin_13()
+        return self.as_upc_a().zfill(13)
 
     def as_gtin_14(self) -> str:
         """Format as GTIN-14."""
-        from biip.gtin import Gtin
-
-        return Gtin.parse(self.as_upc_a()).as_gtin_14()
+        return self.as_upc_a().zfill(14)
 
 
 def _upc_e_to_upc_a_expansion(value: str) -> str:
     assert len(value) == 8
-    assert value.isdecimal()
 
     last_digit = int(value[6])
-    check_digit = int(value[7])
+    check_digit = value[7]
 
-    if last_digit in (0, 1, 2):
+    if last_digit <= 2:
         return f"{value[:3]}{last_digit}0000{value[3:6]}{check_digit}"
 
     if last_digit == 3:
@@ -282,7 +278,7 @@ def _upc_e_to_upc_a_expansion(value: str) -> str:
     if last_digit == 4:
         return f"{value[:5]}00000{value[5]}{check_digit}"
 
-    if last_digit in (5, 6, 7, 8, 9):
+    if last_digit >= 5:
         return f"{value[:6]}0000{last_digit}{check_digit}"
 
     msg = (  # pragma: no cover
@@ -293,11 +289,10 @@ def _upc_e_to_upc_a_expansion(value: str) -> str:
 
 def _upc_a_to_upc_e_suppression(value: str) -> str:
     assert len(value) == 12
-    assert value.isdecimal()
 
-    check_digit = int(value[11])
+    check_digit = value[11]
 
-    if int(value[10]) in (5, 6, 7, 8, 9) and value[6:10] == "0000" and value[5] != "0":
+    if int(value[10]) >= 5 and value[6:10] == "0000" and value[5] != "0":
         # UPC-E suppression, condition A
         return f"{value[:6]}{value[10]}{check_digit}"
 
@@ -305,11 +300,11 @@ def _upc_a_to_upc_e_suppression(value: str) -> str:
         # UPC-E suppression, condition B
         return f"{value[:5]}{value[10]}4{check_digit}"
 
-    if value[4:8] == "0000" and int(value[3]) in (0, 1, 2):
+    if value[4:8] == "0000" and int(value[3]) <= 2:
         # UPC-E suppression, condition C
         return f"{value[:3]}{value[8:11]}{value[3]}{check_digit}"
 
-    if value[4:9] == "00000" and int(value[3]) in range(3, 10):
+    if value[4:9] == "00000" and int(value[3]) >= 3:
         # UPC-E suppression, condition D
         return f"{value[:4]}{value[9:11]}3{check_digit}"
 
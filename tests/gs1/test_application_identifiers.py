@@ -2,6 +2,7 @@ import pytest
 
 from biip import ParseError
 from biip.gs1 import GS1ApplicationIdentifier
+from biip.gs1._application_identifiers import _GS1_APPLICATION_IDENTIFIERS
 
 
 @pytest.mark.parametrize("unknown_ai", ["abcdef", "3376999999"])
@@ -46,6 +47,13 @@ def test_extract_gs1_ai(value: str, expected: GS1ApplicationIdentifier) -> None:
     assert GS1ApplicationIdentifier.extract(value) == expected
 
 
+def test_gs1_ais_are_prefix_free() -> None:
+    # GS1ApplicationIdentifier.extract() depends on this property.
+    ais = list(_GS1_APPLICATION_IDENTIFIERS)
+
+    assert not [(a, b) for a in ais for b in ais if a != b and b.startswith(a)]
+
+
 def test_gs1_ai_object_len_is_ai_str_len() -> None:
     ai = GS1ApplicationIdentifier.extract("01")
 
@@ -31,6 +31,10 @@ def test_numeric_check_digit(value: str, expected: int) -> None:
     assert numeric_check_digit(value) == expected
 
 
+def test_numeric_check_digit_with_non_ascii_digits() -> None:
+    assert numeric_check_digit("१५७०३५३८१४१०३७५१७") == 7
+
+
 @pytest.mark.parametrize("value", ["abc", "⁰⁰⁰"])
 def test_price_check_digit_with_nonnumeric_value(value: str) -> None:
     with pytest.raises(
@@ -16,3 +16,10 @@ def test_gs1_symbology_with_gtin() -> None:
     # Even though GS1-128 can contain a GTIN,
     # it cannot be parsed with a pure GTIN parser.
     assert GS1Symbology.GS1_128 not in GS1Symbology.with_gtin()
+
+
+def test_gs1_symbology_helpers_return_new_sets() -> None:
+    symbologies = GS1Symbology.with_gtin()
+    symbologies.add(GS1Symbology.GS1_128)
+
+    assert GS1Symbology.GS1_128 not in GS1Symbology.with_gtin()
@@ -1,5 +1,6 @@
 import pytest
 
+from biip.gs1 import GS1Prefix
 from biip.gtin import Gtin, GtinFormat, Rcn, RcnRegion, RcnUsage
 
 
@@ -54,6 +55,19 @@ def test_gtin_14_with_rcn_prefix_is_not_an_rcn() -> None:
     assert gtin.format == GtinFormat.GTIN_14
 
 
+def test_rcn_with_prefix_not_for_rcns_has_no_usage() -> None:
+    rcn = Rcn(
+        value="5901234123457",
+        format=GtinFormat.GTIN_13,
+        prefix=GS1Prefix(value="590", usage="GS1 Poland"),
+        company_prefix=None,
+        payload="590123412345",
+        check_digit=7,
+    )
+
+    assert rcn.usage is None
+
+
 @pytest.mark.parametrize(
     ("value", "rcn_region"),
     [